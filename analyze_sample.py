@@ -11,13 +11,28 @@ explore_apis.py에서 수집한 샘플 데이터를 분석:
 
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # 미설치 시 load_json으로 전체 로드
+    ijson = None
 
 # 데이터 저장 경로
 DATA_DIR = Path("data/sample")
 
+# 응답 JSON 경로 (ijson prefix)
+TOTAL_COUNT_PREFIX = 'response.body.totalCount'
+ITEMS_PREFIX = 'response.body.items.item'
+
 
 def load_json(filename: str) -> Dict:
     """JSON 파일 로드"""
@@ -26,64 +41,161 @@ def load_json(filename: str) -> Dict:
         print(f"✗ 파일 없음: {filepath}")
         return {}
 
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
+def load_response_body(filename: str) -> Dict:
+    """
+    ijson 미설치 시 응답 body 로드
+
+    totalCount와 item 목록을 같은 파일에서 읽으므로 파일별로 한 번만 파싱
+    (존재하는 파일에만 호출, 분석 함수는 읽기 전용으로 사용)
+    """
+    return load_json(filename).get('response', {}).get('body', {})
+
+
+def load_total_count(filename: str) -> Optional[int]:
+    """
+    응답 JSON의 totalCount 로드 (item 목록은 파싱하지 않음)
+
+    Returns:
+        totalCount (파일 없으면 None)
+    """
+    filepath = DATA_DIR / filename
+    if not filepath.exists():
+        print(f"✗ 파일 없음: {filepath}")
+        return None
+
+    if ijson is None:
+        return load_response_body(filename).get('totalCount', 0)
+
+    with open(filepath, 'rb') as f:
+        return next(ijson.items(f, TOTAL_COUNT_PREFIX), 0)
+
+
+def iter_items(filename: str) -> Iterator[Dict]:
+    """
+    응답 JSON의 item 목록을 한 건씩 순회 (ijson 스트리밍 파싱)
+
+    단건 응답처럼 item이 배열이 아닌 객체인 경우도 처리
+    """
+    filepath = DATA_DIR / filename
+    if not filepath.exists():
+        return
+
+    if ijson is None:
+        items = load_response_body(filename).get('items', {}).get('item', [])
+        if isinstance(items, dict):
+            items = [items]
+        yield from items
+        return
+
+    found = False
+    with open(filepath, 'rb') as f:
+        for item in ijson.items(f, ITEMS_PREFIX + '.item', use_float=True):
+            found = True
+            yield item
+
+    if not found:
+        with open(filepath, 'rb') as f:
+            for item in ijson.items(f, ITEMS_PREFIX, use_float=True):
+                if isinstance(item, dict):
+                    yield item
+
+
+def add_item_digest(digest_sum: int, item: Dict) -> int:
+    """item 해시(키 정렬 직렬화 기준)를 누적 합에 더함 (64비트)"""
+    if orjson is not None:
+        canonical = orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(item, sort_keys=True)
+    return (digest_sum + hash(canonical)) & 0xFFFFFFFFFFFFFFFF
+
+
+def items_signature(items: Iterable[Dict]) -> Tuple[int, int]:
+    """
+    item 목록의 순서 무관 요약값 (건수, 항목별 해시 합)
+
+    두 목록을 메모리에 동시에 올리지 않고 스트리밍으로 동일 여부 비교
+    (XOR 대신 합을 사용하여 중복 항목이 서로 상쇄되지 않도록 함)
+    """
+    count = 0
+    digest_sum = 0
+    for item in items:
+        count += 1
+        digest_sum = add_item_digest(digest_sum, item)
+
+    return count, digest_sum
+
+
+def save_json(data, filepath: Path):
+    """JSON 파일 저장 (test_parsing.py가 읽어 들이는 파일이므로 compact 형식)"""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        return
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
 def analyze_api12_subsidence_list():
     """API-12: 사고 리스트 분석"""
     print("\n" + "="*80)
     print("📊 [API-12] 지반침하사고 리스트 분석")
     print("="*80)
 
-    data = load_json('API-12_subsidence_list.json')
+    total_count = load_total_count('API-12_subsidence_list.json')
 
-    if not data:
+    if total_count is None:
         print("✗ 데이터 없음")
         return
 
-    body = data.get('response', {}).get('body', {})
-    total_count = body.get('totalCount', 0)
-    items = body.get('items', {}).get('item', [])
+    # 시군구 / 원인 / 연도 분포 (스트리밍 단일 순회)
+    sample_count = 0
+    sigungu_counts = Counter()
+    cause_counts = Counter()
+    year_counts = Counter()
+    for item in iter_items('API-12_subsidence_list.json'):
+        sample_count += 1
+        sigungu_counts[item.get('siGunGu', '미상')] += 1
+
+        cause = item.get('sagoDetail', '확정중')
+        if not cause or cause.strip() == '':
+            cause = '확정중'
+        cause_counts[cause] += 1
 
-    if isinstance(items, dict):
-        items = [items]
+        sago_date = item.get('sagoDate') or ''
+        if len(sago_date) >= 4:
+            year_counts[sago_date[:4]] += 1
 
     print(f"\n✅ 전체 데이터 건수: {total_count}건 (2023년 기준)")
-    print(f"✅ 샘플 수집: {len(items)}건")
+    print(f"✅ 샘플 수집: {sample_count}건")
 
-    # 시군구별 분포
-    sigungu_counts = Counter(item.get('siGunGu', '미상') for item in items)
     print(f"\n📍 시군구별 분포 (샘플):")
     for sigungu, count in sigungu_counts.most_common(5):
         print(f"  {sigungu}: {count}건")
 
-    # 원인별 분포
-    cause_counts = Counter()
-    for item in items:
-        cause = item.get('sagoDetail', '확정중')
-        if not cause or cause.strip() == '':
-            cause = '확정중'
-        cause_counts[cause] += 1
-
     print(f"\n🔍 사고 원인 분포 (샘플):")
     for cause, count in cause_counts.most_common(5):
         print(f"  {cause}: {count}건")
 
-    # 날짜 분포
-    dates = [item.get('sagoDate', '') for item in items if item.get('sagoDate')]
-    if dates:
-        years = [d[:4] for d in dates if len(d) >= 4]
-        year_counts = Counter(years)
+    if year_counts:
         print(f"\n📅 연도별 분포 (샘플):")
         for year in sorted(year_counts.keys()):
             print(f"  {year}년: {year_counts[year]}건")
 
     return {
         'total_count': total_count,
-        'sample_count': len(items),
+        'sample_count': sample_count,
         'sigungu_distribution': dict(sigungu_counts),
-        'year_distribution': dict(Counter(years)) if dates else {}
+        'year_distribution': dict(year_counts)
     }
 
 
@@ -153,39 +265,35 @@ def analyze_api7_evaluation_list():
     print("📊 [API-7] 지반침하위험도평가 리스트 분석")
     print("="*80)
 
-    data = load_json('API-7_evaluation_list.json')
+    total_count = load_total_count('API-7_evaluation_list.json')
 
-    if not data:
+    if total_count is None:
         print("✗ 데이터 없음")
         return
 
-    body = data.get('response', {}).get('body', {})
-    total_count = body.get('totalCount', 0)
-    items = body.get('items', {}).get('item', [])
-
-    if isinstance(items, dict):
-        items = [items]
+    # evalNm 샘플 수집 (파싱 테스트용, 앞 10건)
+    sample_count = 0
+    eval_names = []
+    for item in iter_items('API-7_evaluation_list.json'):
+        sample_count += 1
+        if len(eval_names) < 10:
+            eval_names.append(item.get('evalNm', ''))
 
     print(f"\n✅ 전체 데이터 건수: {total_count}건 (2023년 기준)")
-    print(f"✅ 샘플 수집: {len(items)}건")
+    print(f"✅ 샘플 수집: {sample_count}건")
 
-    # evalNm 샘플 수집 (파싱 테스트용)
     print(f"\n⚠️  평가명 (evalNm) 샘플 (위치 정보 추출 대상):")
-    eval_names = []
-    for idx, item in enumerate(items[:10], 1):
-        eval_nm = item.get('evalNm', '')
-        eval_names.append(eval_nm)
+    for idx, eval_nm in enumerate(eval_names, 1):
         print(f"  [{idx}] {eval_nm}")
 
     # evalNm 저장 (test_parsing.py에서 사용)
     eval_names_file = DATA_DIR / 'eval_names_sample.json'
-    with open(eval_names_file, 'w', encoding='utf-8') as f:
-        json.dump(eval_names, f, ensure_ascii=False, indent=2)
+    save_json(eval_names, eval_names_file)
     print(f"\n✓ evalNm 샘플 저장: {eval_names_file}")
 
     return {
         'total_count': total_count,
-        'sample_count': len(items),
+        'sample_count': sample_count,
         'eval_names': eval_names
     }
 
@@ -196,71 +304,70 @@ def analyze_api8_safety_measures():
     print("📊 [API-8] 안전조치내용 분석")
     print("="*80)
 
-    data = load_json('API-8_safety_measures.json')
+    total_count = load_total_count('API-8_safety_measures.json')
 
-    if not data:
+    if total_count is None:
         print("✗ 데이터 없음")
         return
 
-    body = data.get('response', {}).get('body', {})
-    total_count = body.get('totalCount', 0)
-    items = body.get('items', {}).get('item', [])
-
-    if isinstance(items, dict):
-        items = [items]
+    # 명령사유 샘플 (위험도 추정 가능) + 조치 완료 건수 + API-9 비교용 해시 (스트리밍 단일 순회)
+    sample_count = 0
+    digest_sum = 0
+    reasons = []
+    completed = 0
+    for item in iter_items('API-8_safety_measures.json'):
+        sample_count += 1
+        digest_sum = add_item_digest(digest_sum, item)
+        if len(reasons) < 5:
+            reasons.append(item.get('orderReason', ''))
+        if '완료' in item.get('actResult', ''):
+            completed += 1
 
     print(f"\n✅ 총 안전조치 건수: {total_count}건")
-    print(f"✅ 샘플 수집: {len(items)}건")
+    print(f"✅ 샘플 수집: {sample_count}건")
 
-    if len(items) > 0:
-        # 명령사유 분석 (위험도 추정 가능)
-        reasons = [item.get('orderReason', '') for item in items]
+    if sample_count > 0:
         print(f"\n📋 명령사유 샘플:")
-        for idx, reason in enumerate(reasons[:5], 1):
+        for idx, reason in enumerate(reasons, 1):
             print(f"  [{idx}] {reason}")
 
         # 조치 완료율
-        completed = sum(1 for item in items if '완료' in item.get('actResult', ''))
-        completion_rate = completed / len(items) * 100 if items else 0
-        print(f"\n✅ 조치 완료율: {completion_rate:.1f}% ({completed}/{len(items)})")
+        completion_rate = completed / sample_count * 100
+        print(f"\n✅ 조치 완료율: {completion_rate:.1f}% ({completed}/{sample_count})")
 
     return {
         'total_count': total_count,
-        'sample_count': len(items)
+        'sample_count': sample_count,
+        'signature': (sample_count, digest_sum)  # API-9 동일 여부 비교용 (파일 재로드 방지)
     }
 
 
-def analyze_api9_emergency_measures():
-    """API-9: 응급조치내용 분석"""
+def analyze_api9_emergency_measures(api8_signature: Optional[Tuple[int, int]] = None):
+    """
+    API-9: 응급조치내용 분석
+
+    Args:
+        api8_signature: analyze_api8_safety_measures에서 계산한 API-8 items_signature
+    """
     print("\n" + "="*80)
     print("📊 [API-9] 응급조치내용 분석")
     print("="*80)
 
-    data = load_json('API-9_emergency_measures.json')
+    total_count = load_total_count('API-9_emergency_measures.json')
 
-    if not data:
+    if total_count is None:
         print("✗ 데이터 없음")
         return
 
-    body = data.get('response', {}).get('body', {})
-    total_count = body.get('totalCount', 0)
-    items = body.get('items', {}).get('item', [])
-
-    if isinstance(items, dict):
-        items = [items]
+    signature = items_signature(iter_items('API-9_emergency_measures.json'))
+    sample_count = signature[0]
 
     print(f"\n✅ 총 응급조치 건수: {total_count}건")
-    print(f"✅ 샘플 수집: {len(items)}건")
-
-    # API-8과 동일 여부 확인
-    api8_data = load_json('API-8_safety_measures.json')
-    if api8_data:
-        api8_body = api8_data.get('response', {}).get('body', {})
-        api8_items = api8_body.get('items', {}).get('item', [])
-        if isinstance(api8_items, dict):
-            api8_items = [api8_items]
+    print(f"✅ 샘플 수집: {sample_count}건")
 
-        is_same = (json.dumps(items, sort_keys=True) == json.dumps(api8_items, sort_keys=True))
+    # API-8과 동일 여부 확인 (건수 + 항목 해시 비교)
+    if api8_signature is not None:
+        is_same = (signature == api8_signature)
         print(f"\n⚠️  API-8과 동일 데이터 여부: {'YES' if is_same else 'NO'}")
         if is_same:
             print(f"  → API-8과 API-9는 동일한 endpoint 사용")
@@ -268,7 +375,7 @@ def analyze_api9_emergency_measures():
 
     return {
         'total_count': total_count,
-        'sample_count': len(items)
+        'sample_count': sample_count
     }
 
 
@@ -362,7 +469,7 @@ def main():
     results['api8'] = analyze_api8_safety_measures()
 
     # API-9 분석
-    results['api9'] = analyze_api9_emergency_measures()
+    results['api9'] = analyze_api9_emergency_measures((results['api8'] or {}).get('signature'))
 
     # 종합 리포트
     generate_summary_report(results)
@@ -16,6 +16,15 @@ import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
+from urllib.parse import unquote
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 json 사용
+    orjson = None
 
 # API 설정
 BASE_URL = "https://apis.data.go.kr/1613000/undergroundsafetyinfo01"
@@ -29,16 +38,47 @@ SERVICE_KEY = "68a85e06ae9d0b59a663bf0952252ef0ed9c001ccde331df02f38d78ee6197e4"
 # 참고: 공공데이터포털 마이페이지 → 오픈API → 활용신청 현황에서 확인
 # ============================================================================
 
+# requests가 쿼리스트링을 인코딩하므로 디코딩된 키 사용 (인코딩 키 입력 시 대비)
+DECODED_SERVICE_KEY = unquote(SERVICE_KEY)
+
 # 데이터 저장 경로
 DATA_DIR = Path("data/sample")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def create_session() -> requests.Session:
+    """
+    API 호출용 HTTP 세션 생성
+
+    연결 풀 / keep-alive로 호출마다 TCP·TLS 연결을 새로 맺지 않음
+    일시적인 서버 오류(5xx)는 지수 백오프로 재시도
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        raise_on_status=False  # 재시도 소진 시 마지막 응답을 그대로 반환 (HTTP 에러 출력용)
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = create_session()
+
+
 def save_json(data: Dict, filename: str):
-    """JSON 파일 저장"""
+    """JSON 파일 저장 (응답 구조 파악용이므로 사람이 읽기 쉽게 indent 유지)"""
     filepath = DATA_DIR / filename
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     print(f"✓ 저장 완료: {filepath}")
 
 
@@ -54,10 +94,8 @@ def api_request(endpoint: str, params: Dict, description: str = "") -> Optional[
     Returns:
         API 응답 딕셔너리 또는 None (실패 시)
     """
-    from urllib.parse import urlencode, unquote
-
     url = f"{BASE_URL}/{endpoint}"
-    params['serviceKey'] = SERVICE_KEY
+    params['serviceKey'] = DECODED_SERVICE_KEY
     params['type'] = 'json'
 
     print(f"\n{'='*60}")
@@ -66,14 +104,10 @@ def api_request(endpoint: str, params: Dict, description: str = "") -> Optional[
     print(f"Params: {params}")
 
     try:
-        # URL 빌드 (serviceKey는 인코딩하지 않음)
-        query_params = {k: v for k, v in params.items() if k != 'serviceKey'}
-        query_string = urlencode(query_params)
-        full_url = f"{url}?{query_string}&serviceKey={unquote(SERVICE_KEY)}"
-
-        print(f"Full URL (처음 100자): {full_url[:100]}...")
+        # 쿼리스트링 인코딩은 requests에 위임
+        response = _SESSION.get(url, params=params, timeout=30)
 
-        response = requests.get(full_url, timeout=30)
+        print(f"Full URL (처음 100자): {response.url[:100]}...")
 
         # 에러 응답 상세 확인
         if response.status_code != 200:
@@ -81,7 +115,7 @@ def api_request(endpoint: str, params: Dict, description: str = "") -> Optional[
             print(f"Response: {response.text[:500]}")
             return None
 
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
 
         # 결과 코드 확인
         header = data.get('response', {}).get('header', {})
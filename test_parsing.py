@@ -10,179 +10,438 @@ API-7의 evalNm (평가명) 필드에서 위치 정보 추출 테스트:
 목표: 70% 이상 파싱 성공 → 전체 수집 GO
 """
 
+import csv
 import json
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
-from collections import Counter
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import product
+
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:  # 미설치 시 순수 Python 트라이로 스캔
+    ahocorasick = None
 
 # 데이터 저장 경로
 DATA_DIR = Path("data/sample")
 
+# 파싱 테스트 결과 (행 단위 JSON Lines + 집계 요약)
+RESULTS_FILE = DATA_DIR / 'parsing_test_results.jsonl'
+SUMMARY_FILE = DATA_DIR / 'parsing_test_summary.json'
+
+# 행별 출력은 이 건수만큼 모아서 한 번에 기록 (print 호출 수 절감, 메모리 상한 유지)
+PRINT_BATCH_SIZE = 1000
+
 # 서울시 행정동 데이터 로드
 SEOUL_DONG_FILE = Path("data/seoul_424dong.csv")
 
+# 시도 가제티어
+CITY_NAMES = ('서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종')
+
+# 위치 패턴 (가제티어 미적중 시 폴백)
+_DISTRICT_RE = re.compile(r'([가-힣]+구)')
+_DONG_RE = re.compile(r'([가-힣]+동|[가-힣]+읍|[가-힣]+면)')
+
+# 서울시 구 적중을 인정하는 바로 앞 접두 (서울/서울특별시/'~시' 등)
+_DISTRICT_PREFIXES = CITY_NAMES + ('시',)
+
+# 서울 외 광역시에도 있는 서울시 구 이름 (다른 시도명 바로 뒤에 오면 그 시도 소속)
+_SHARED_DISTRICT_NAMES = frozenset({'중구', '강서구'})
+
+# 시도명과 바로 뒤 구 사이에 올 수 있는 문자열 ("부산중구", "부산 중구", "광주광역시 중구")
+_CITY_DISTRICT_GAP_RE = re.compile(r'(?:광역시|특별자치시|시)?\s*')
+
+# 시도명 바로 뒤에 오면 시도가 아닌 도로/시설명으로 보는 접미 ("세종대로", "인천공항철도")
+_CITY_NON_SUFFIXES = ('대로', '로', '길', '공항', '철도')
+
+# 신뢰도 테이블: (시도, 구, 동, 동 가제티어 검증) 추출 여부 → 신뢰도
+# 시도+구+동 모두 추출 시 검증된 동이면 high, 아니면 medium / 그 외 low
+_CONFIDENCE = {
+    key: ('high' if key[3] else 'medium') if all(key[:3]) else 'low'
+    for key in product((False, True), repeat=4)
+}
+
+# 조기 종료 판정용 부분 문자열: 구(서울시 구 / '~구' 폴백 모두 '구'로 끝남) + 시도명
+# 하나도 없으면 시도·구를 찾을 수 없고, 동은 구가 있을 때만 추출하므로 추출 결과 없음
+_LOCATION_NEEDLES = ('구',) + CITY_NAMES
+
+
+def load_json(filepath: Path):
+    """JSON 파일 로드"""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(data, filepath: Path):
+    """JSON 파일 저장 (공백 없는 compact 형식)"""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        return
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps_line(data) -> bytes:
+    """JSON Lines 한 줄 직렬화 (compact + 줄바꿈)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class Location(NamedTuple):
+    """evalNm 위치 추출 결과 (lru_cache에 안전하게 저장되도록 불변)"""
+    city: Optional[str]
+    district: Optional[str]
+    dong: Optional[str]
+    confidence: str
+
+
+_UNKNOWN_LOCATION = Location(None, None, None, 'low')
+
 
-def load_seoul_dongs() -> Dict[str, List[str]]:
+def load_seoul_dongs() -> Dict[str, FrozenSet[str]]:
     """
     서울시 424개 행정동 데이터 로드
 
     Returns:
         {
-            '구': ['동1', '동2', ...],
+            '구': frozenset({'동1', '동2', ...}),
             ...
         }
     """
-    dongs_by_district = {}
+    dongs_by_district = defaultdict(set)
 
     if not SEOUL_DONG_FILE.exists():
         print(f"✗ 행정동 데이터 파일 없음: {SEOUL_DONG_FILE}")
         return {}
 
-    with open(SEOUL_DONG_FILE, 'r', encoding='utf-8') as f:
-        lines = f.readlines()[1:]  # Skip header
+    with open(SEOUL_DONG_FILE, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip header
 
-    for line in lines:
-        parts = line.strip().split(',')
-        if len(parts) >= 3:
-            district = parts[1]  # 구
-            dong = parts[2]      # 동
+        for row in reader:
+            if len(row) >= 3:
+                district = row[1]  # 구
+                dong = row[2]      # 동
 
-            if district not in dongs_by_district:
-                dongs_by_district[district] = []
+                dongs_by_district[district].add(dong)
 
-            dongs_by_district[district].append(dong)
+    return {district: frozenset(dongs) for district, dongs in dongs_by_district.items()}
 
-    print(f"✓ 서울시 행정동 데이터 로드: {len(dongs_by_district)}개 구")
-    return dongs_by_district
 
+def build_dong_index(seoul_dongs: Dict[str, FrozenSet[str]]) -> Dict[str, FrozenSet[str]]:
+    """
+    동 → 소속 구 역색인 생성
+
+    동 이름은 여러 구에 중복될 수 있음 (예: 신사동 - 강남구/관악구)
 
-def extract_location_from_evalNm(eval_nm: str, seoul_dongs: Dict[str, List[str]]) -> Dict[str, str]:
+    Returns:
+        {
+            '동': frozenset({'구1', ...}),
+            ...
+        }
     """
-    evalNm에서 위치 정보 추출 (휴리스틱)
+    districts_by_dong = defaultdict(set)
+    for district, dongs in seoul_dongs.items():
+        for dong in dongs:
+            districts_by_dong[dong].add(district)
+
+    return {dong: frozenset(districts) for dong, districts in districts_by_dong.items()}
+
+
+def iter_gazetteer_entries(seoul_dongs: Dict[str, FrozenSet[str]]) -> Iterator[Tuple[str, Tuple]]:
+    """
+    가제티어 (단어, payload) 목록
+
+    payload: ('city'|'district'|'dong', 값, 소속 구 frozenset 또는 None)
+    """
+    for city in CITY_NAMES:
+        yield city, ('city', city, None)
+    for district in seoul_dongs:
+        yield district, ('district', district, None)
+    for dong, districts in build_dong_index(seoul_dongs).items():
+        yield dong, ('dong', dong, districts)
+
+
+def build_gazetteer_automaton(seoul_dongs: Dict[str, FrozenSet[str]]):
+    """
+    시도 + 서울시 구/동 가제티어로 Aho-Corasick 오토마톤 생성
+
+    evalNm을 한 번만 스캔하여 (종류, 값, 상위 구) 적중을 모두 얻기 위함
 
     Args:
-        eval_nm: 평가명 (예: "포천동성남시탄리(1,2공사) 향후계획서의 설치공사")
         seoul_dongs: 서울시 행정동 딕셔너리
 
     Returns:
-        {
-            'city': '서울특별시',
-            'district': '강남구',
-            'dong': '역삼동',
-            'confidence': 'high/medium/low'
-        }
+        payload가 iter_gazetteer_entries()와 같은 Automaton
+        (pyahocorasick 미설치 시 None)
     """
-    location = {
-        'city': None,
-        'district': None,
-        'dong': None,
-        'confidence': 'low'
-    }
+    if ahocorasick is None:
+        return None
 
-    # 패턴 정의
-    city_pattern = r'(서울|부산|대구|인천|광주|대전|울산|세종)'
-    district_pattern = r'([가-힣]+구)'
-    dong_pattern = r'([가-힣]+동|[가-힣]+읍|[가-힣]+면)'
+    automaton = ahocorasick.Automaton()
+    for word, payload in iter_gazetteer_entries(seoul_dongs):
+        automaton.add_word(word, payload)
+    automaton.make_automaton()
 
-    # 1. 시도 추출
-    city_match = re.search(city_pattern, eval_nm)
-    if city_match:
-        city = city_match.group(1)
-        if city == '서울':
-            location['city'] = '서울특별시'
-        else:
-            location['city'] = city
-
-    # 2. 시군구 추출 (서울시 구 우선)
-    district_matches = re.findall(district_pattern, eval_nm)
-    if district_matches:
-        # 서울시 구인지 확인
-        for district in district_matches:
-            if district in seoul_dongs:
-                location['district'] = district
-                location['city'] = '서울특별시'  # 서울시 구 발견 시 city도 업데이트
+    return automaton
+
+
+_TRIE_END = ''  # 트라이 노드의 단어 끝 표시 키 (한 글자 키와 겹치지 않음)
+
+
+def build_gazetteer_trie(seoul_dongs: Dict[str, FrozenSet[str]]) -> Dict:
+    """
+    pyahocorasick 미설치 시 사용할 가제티어 트라이 (중첩 dict)
+
+    "서울강남구역삼1동"처럼 붙여 쓴 evalNm도 글자 단위로 걸어가며 인식
+    ([가-힣]+동 정규식은 "구역삼1동"처럼 앞 글자까지 탐욕적으로 매칭)
+    """
+    trie = {}
+    for word, payload in iter_gazetteer_entries(seoul_dongs):
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = payload
+
+    return trie
+
+
+def iter_gazetteer_hits(eval_nm: str) -> Iterator[Tuple[int, Tuple]]:
+    """evalNm 내 가제티어 적중 (시작 위치, payload) 순회 (오토마톤 우선, 없으면 트라이)"""
+    if _AUTOMATON is not None:
+        for end, payload in _AUTOMATON.iter(eval_nm):
+            yield end - len(payload[1]) + 1, payload
+        return
+
+    length = len(eval_nm)
+    for start in range(length):
+        node = _TRIE.get(eval_nm[start])
+        if node is None:
+            continue
+
+        hits = []
+        pos = start + 1
+        while True:
+            payload = node.get(_TRIE_END)
+            if payload is not None:
+                hits.append(payload)
+            if pos == length:
                 break
+            node = node.get(eval_nm[pos])
+            if node is None:
+                break
+            pos += 1
+
+        # 같은 시작 위치에서는 긴 단어 우선
+        for payload in reversed(hits):
+            yield start, payload
+
+
+def is_city_boundary(eval_nm: str, start: int, end: int) -> bool:
+    """
+    시도 적중이 독립된 시도명인지 확인
+
+    한글 뒤("해운대구"의 '대구')나 도로/시설명 접미 앞("세종대로")은 제외
+    """
+    if start > 0 and '가' <= eval_nm[start - 1] <= '힣':
+        return False
+    return not eval_nm.startswith(_CITY_NON_SUFFIXES, end)
+
+
+def is_district_boundary(eval_nm: str, start: int) -> bool:
+    """
+    구 적중 위치가 토큰 경계인지 확인
+
+    문자열 시작, 한글이 아닌 문자(공백 등) 뒤, 시도명/'~시' 접두 뒤만 인정
+    ("집중구역"의 '중구'처럼 단어 중간 적중 제외)
+    """
+    if start == 0:
+        return True
+    if not '가' <= eval_nm[start - 1] <= '힣':
+        return True
+    return eval_nm.endswith(_DISTRICT_PREFIXES, 0, start)
+
+
+# 서울시 행정동 가제티어 (모듈 로드 시 1회 생성)
+SEOUL_DONGS = load_seoul_dongs()
+_AUTOMATON = build_gazetteer_automaton(SEOUL_DONGS)
+_TRIE = build_gazetteer_trie(SEOUL_DONGS) if _AUTOMATON is None else None
+
 
-        # 서울시 구가 아니면 첫 번째 매치
-        if not location['district']:
-            location['district'] = district_matches[0]
+@lru_cache(maxsize=4096)
+def extract_location_from_evalNm(eval_nm: str) -> Location:
+    """
+    evalNm에서 위치 정보 추출 (휴리스틱)
+
+    동일한 evalNm은 캐시된 결과를 반환
+
+    Args:
+        eval_nm: 평가명 (예: "포천동성남시탄리(1,2공사) 향후계획서의 설치공사")
+
+    Returns:
+        Location(city='서울특별시', district='강남구', dong='역삼동',
+                 confidence='high/medium/low')
+    """
+    # 위치 단서가 전혀 없으면 스캔 생략
+    if not any(needle in eval_nm for needle in _LOCATION_NEEDLES):
+        return _UNKNOWN_LOCATION
+
+    # 0. 가제티어 단일 스캔 (카테고리별 첫 적중)
+    city = None
+    city_end = 0
+    seoul_district = None
+    dong_hits = []
+    for start, (kind, value, districts) in iter_gazetteer_hits(eval_nm):
+        if kind == 'city':
+            if city is None and is_city_boundary(eval_nm, start, start + len(value)):
+                city = value
+                city_end = start + len(value)
+        elif kind == 'district':
+            # 토큰 경계에서만 인정, 서울 외 시도명 바로 뒤의 공통 구("부산 중구")는 그 시도 소속으로 보고 제외
+            if (seoul_district is None and is_district_boundary(eval_nm, start)
+                    and not (value in _SHARED_DISTRICT_NAMES and city not in (None, '서울')
+                             and _CITY_DISTRICT_GAP_RE.fullmatch(eval_nm, city_end, start))):
+                seoul_district = value
+        else:
+            dong_hits.append((value, districts))
+
+    # 1. 시도 추출
+    if city == '서울':
+        city = '서울특별시'
+
+    # 2. 시군구 추출 (서울시 구 우선, 없으면 첫 번째 '~구' 매치)
+    district = None
+    if seoul_district:
+        district = seoul_district
+        city = '서울특별시'  # 서울시 구 발견 시 city도 업데이트
+    else:
+        district_match = _DISTRICT_RE.search(eval_nm)
+        if district_match:
+            district = district_match.group(1)
 
     # 3. 읍면동 추출
-    dong_matches = re.findall(dong_pattern, eval_nm)
-    if dong_matches and location['district']:
-        # 해당 구의 동 리스트 확인
-        valid_dongs = seoul_dongs.get(location['district'], [])
-
-        for dong in dong_matches:
-            if dong in valid_dongs:
-                location['dong'] = dong
-                location['confidence'] = 'high'
+    dong = None
+    dong_verified = False
+    if district:
+        # 가제티어 동 중 해당 구 소속인 첫 번째 적중 (서울시 구일 때만)
+        for hit, districts in dong_hits if seoul_district else ():
+            if district in districts:
+                dong = hit
+                dong_verified = True
                 break
 
         # 유효한 동이 없으면 첫 번째 매치
-        if not location['dong'] and dong_matches:
-            location['dong'] = dong_matches[0]
-            location['confidence'] = 'medium'
+        if not dong:
+            dong_match = _DONG_RE.search(eval_nm)
+            if dong_match:
+                dong = dong_match.group(1)
 
-    # 신뢰도 조정
-    if location['city'] and location['district'] and location['dong']:
-        if location['confidence'] != 'high':
-            location['confidence'] = 'medium'
-    elif location['city'] or location['district']:
-        location['confidence'] = 'low'
+    # 4. 신뢰도
+    confidence = _CONFIDENCE[(bool(city), bool(district), bool(dong), dong_verified)]
 
-    return location
+    return Location(city, district, dong, confidence)
 
 
-def test_parsing_on_samples(eval_names: List[str], seoul_dongs: Dict[str, List[str]]) -> Dict:
+def test_parsing_on_samples(eval_names: List[str]) -> Dict:
     """
     샘플 evalNm 리스트로 파싱 테스트
 
+    행별 결과는 RESULTS_FILE에 JSON Lines로 바로 기록하고
+    메모리에는 집계만 유지 (행별 결과는 쌓지 않음,
+    입력 리스트 외 추가 메모리는 집계와 lru_cache 크기로 제한)
+
     Args:
         eval_names: evalNm 리스트
-        seoul_dongs: 서울시 행정동 딕셔너리
 
     Returns:
-        파싱 결과 통계
+        {
+            'total_count': 10,
+            'success_counts': Counter({'city': 8, 'district': 10, 'dong': 9, 'overall': 8}),
+            'confidence_counts': Counter({'high': 3, 'medium': 5, 'low': 2})
+        }
     """
-    results = []
+    total = 0
+    success_counts = Counter()
+    confidence_counts = Counter()
 
     print("\n" + "="*80)
     print("🧪 evalNm 파싱 테스트")
     print("="*80)
 
-    for idx, eval_nm in enumerate(eval_names, 1):
-        location = extract_location_from_evalNm(eval_nm, seoul_dongs)
-
-        result = {
-            'eval_nm': eval_nm,
-            'city': location['city'],
-            'district': location['district'],
-            'dong': location['dong'],
-            'confidence': location['confidence']
-        }
-        results.append(result)
-
-        # 출력
-        city_str = location['city'] or '✗'
-        district_str = location['district'] or '✗'
-        dong_str = location['dong'] or '✗'
-        confidence_str = location['confidence']
-
-        print(f"\n[{idx}] {eval_nm}")
-        print(f"  → 시도: {city_str}")
-        print(f"  → 구:   {district_str}")
-        print(f"  → 동:   {dong_str}")
-        print(f"  → 신뢰도: {confidence_str}")
+    output_lines = []
+
+    with open(RESULTS_FILE, 'wb') as f:
+        for idx, eval_nm in enumerate(eval_names, 1):
+            location = extract_location_from_evalNm(eval_nm)
+            result = {
+                'eval_nm': eval_nm,
+                'city': location.city,
+                'district': location.district,
+                'dong': location.dong,
+                'confidence': location.confidence
+            }
+            f.write(dumps_line(result))
+
+            # 집계
+            total += 1
+            if location.city:
+                success_counts['city'] += 1
+            if location.district:
+                success_counts['district'] += 1
+            if location.dong:
+                success_counts['dong'] += 1
+            if location.city and location.district and location.dong:
+                success_counts['overall'] += 1
+            confidence_counts[location.confidence] += 1
+
+            # 출력 (PRINT_BATCH_SIZE건씩 모아서 기록)
+            city_str = location.city or '✗'
+            district_str = location.district or '✗'
+            dong_str = location.dong or '✗'
+            confidence_str = location.confidence
+
+            output_lines.append(
+                f"\n[{idx}] {eval_nm}\n"
+                f"  → 시도: {city_str}\n"
+                f"  → 구:   {district_str}\n"
+                f"  → 동:   {dong_str}\n"
+                f"  → 신뢰도: {confidence_str}\n"
+            )
+            if len(output_lines) >= PRINT_BATCH_SIZE:
+                sys.stdout.write(''.join(output_lines))
+                output_lines.clear()
+
+    sys.stdout.write(''.join(output_lines))
 
-    return results
+    return {
+        'total_count': total,
+        'success_counts': success_counts,
+        'confidence_counts': confidence_counts
+    }
 
 
-def calculate_success_rate(results: List[Dict]) -> Dict:
+def calculate_success_rate(stats: Dict) -> Dict:
     """
     파싱 성공률 계산
 
+    Args:
+        stats: test_parsing_on_samples() 집계 결과
+
     Returns:
         {
             'city_rate': 0.8,
@@ -191,7 +450,7 @@ def calculate_success_rate(results: List[Dict]) -> Dict:
             'overall_rate': 0.5
         }
     """
-    total = len(results)
+    total = stats['total_count']
 
     if total == 0:
         return {
@@ -201,26 +460,23 @@ def calculate_success_rate(results: List[Dict]) -> Dict:
             'overall_rate': 0.0
         }
 
-    city_success = sum(1 for r in results if r['city'])
-    district_success = sum(1 for r in results if r['district'])
-    dong_success = sum(1 for r in results if r['dong'])
-    overall_success = sum(1 for r in results if r['city'] and r['district'] and r['dong'])
+    success_counts = stats['success_counts']
 
     return {
-        'city_rate': city_success / total * 100,
-        'district_rate': district_success / total * 100,
-        'dong_rate': dong_success / total * 100,
-        'overall_rate': overall_success / total * 100
+        'city_rate': success_counts['city'] / total * 100,
+        'district_rate': success_counts['district'] / total * 100,
+        'dong_rate': success_counts['dong'] / total * 100,
+        'overall_rate': success_counts['overall'] / total * 100
     }
 
 
-def generate_parsing_report(results: List[Dict], success_rates: Dict):
+def generate_parsing_report(stats: Dict, success_rates: Dict):
     """파싱 테스트 리포트 생성"""
     print("\n" + "🎯"*40)
     print("📊 evalNm 파싱 테스트 결과 리포트")
     print("🎯"*40)
 
-    total = len(results)
+    total = stats['total_count']
 
     print(f"\n1️⃣ 파싱 성공률 (총 {total}건)")
     print("="*60)
@@ -230,7 +486,7 @@ def generate_parsing_report(results: List[Dict], success_rates: Dict):
     print(f"  전체(city+district+dong): {success_rates['overall_rate']:>6.1f}%")
 
     # 신뢰도 분포
-    confidence_counts = Counter(r['confidence'] for r in results)
+    confidence_counts = stats['confidence_counts']
     print(f"\n2️⃣ 신뢰도 분포")
     print("="*60)
     for conf in ['high', 'medium', 'low']:
@@ -260,16 +516,15 @@ def generate_parsing_report(results: List[Dict], success_rates: Dict):
         print(f"     2. 외부 주소 API 활용 (도로명주소 → 행정동)")
         print(f"     3. 수작업 매핑 (소량 데이터인 경우)")
 
-    # 샘플 데이터 저장
-    results_file = DATA_DIR / 'parsing_test_results.json'
-    with open(results_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'results': results,
-            'success_rates': success_rates,
-            'total_count': total
-        }, f, ensure_ascii=False, indent=2)
+    # 집계 요약 저장 (행별 결과는 test_parsing_on_samples에서 기록)
+    save_json({
+        'success_rates': success_rates,
+        'confidence_counts': dict(confidence_counts),
+        'total_count': total
+    }, SUMMARY_FILE)
 
-    print(f"\n✓ 테스트 결과 저장: {results_file}")
+    print(f"\n✓ 테스트 결과 저장: {RESULTS_FILE}")
+    print(f"✓ 테스트 요약 저장: {SUMMARY_FILE}")
 
 
 def main():
@@ -279,8 +534,9 @@ def main():
     print("목표: 70% 이상 파싱 성공 → 전체 수집 GO")
     print("🧪"*40)
 
-    # 서울시 행정동 데이터 로드
-    seoul_dongs = load_seoul_dongs()
+    # 서울시 행정동 데이터 (모듈 로드 시 생성)
+    if SEOUL_DONGS:
+        print(f"✓ 서울시 행정동 데이터 로드: {len(SEOUL_DONGS)}개 구")
 
     # evalNm 샘플 로드
     eval_names_file = DATA_DIR / 'eval_names_sample.json'
@@ -289,19 +545,18 @@ def main():
         print(f"먼저 explore_apis.py와 analyze_sample.py를 실행하세요.")
         return
 
-    with open(eval_names_file, 'r', encoding='utf-8') as f:
-        eval_names = json.load(f)
+    eval_names = load_json(eval_names_file)
 
     print(f"\n✓ evalNm 샘플 로드: {len(eval_names)}건")
 
     # 파싱 테스트
-    results = test_parsing_on_samples(eval_names, seoul_dongs)
+    stats = test_parsing_on_samples(eval_names)
 
     # 성공률 계산
-    success_rates = calculate_success_rate(results)
+    success_rates = calculate_success_rate(stats)
 
     # 리포트 생성
-    generate_parsing_report(results, success_rates)
+    generate_parsing_report(stats, success_rates)
 
     print("\n" + "="*80)
     print("✅ 파싱 테스트 완료!")